@@ -1,8 +1,7 @@
 import io
-import json
-import os
 from datetime import datetime
-from typing import Dict, List, Tuple
+from functools import partial
+from typing import Dict, Tuple
 
 import streamlit as st
 
@@ -11,10 +10,12 @@ from corporate_agent.doc_parser import load_docx_from_bytes, extract_full_text
 from corporate_agent.doc_classifier import classify_document_type
 from corporate_agent.red_flags import detect_red_flags
 from corporate_agent.docx_commenter import build_reviewed_docx
+from corporate_agent.export import build_review_zip, reviewed_docx_name
 from corporate_agent.rag import Retriever
 from corporate_agent.sources import fetch_urls
 from corporate_agent.llm import ClauseSuggester
-from corporate_agent.report import build_report_dict
+from corporate_agent.issues import IssueStore
+from corporate_agent.report import build_report_dict, write_report_json
 
 
 st.set_page_config(page_title="ADGM Corporate Agent", layout="wide")
@@ -32,6 +33,12 @@ def get_suggester() -> ClauseSuggester:
     return ClauseSuggester()
 
 
+def _drop_export() -> None:
+    export = st.session_state.pop("export_zip", None)
+    if export is not None:
+        export[1].close()
+
+
 def main() -> None:
     retriever = get_retriever()
     suggester = get_suggester()
@@ -54,9 +61,9 @@ def main() -> None:
             urls = [u.strip() for u in urls_text.splitlines() if u.strip()]
             if urls:
                 with st.spinner("Fetching and indexing..."):
-                    extra_docs = fetch_urls(urls, save_dir="data/external")
+                    extra_docs = fetch_urls(urls, save_dir="data/external", split_pages=True)
                     retriever.extend_with(extra_docs)
-                st.success(f"Indexed {len(extra_docs)} documents from URLs.")
+                st.success(f"Indexed {len(extra_docs)} documents/pages from {len(urls)} URLs.")
 
     if not uploaded_files:
         st.info("Awaiting files. Upload .docx to begin.")
@@ -104,7 +111,7 @@ def main() -> None:
         st.success("All required documents are present.")
 
     # Analyze red flags and suggestions
-    all_issues: List[Dict] = []
+    store = IssueStore()
     st.subheader("Document Analysis")
     for name, text in doc_texts.items():
         dtype = doc_types.get(name, "Unknown")
@@ -115,64 +122,89 @@ def main() -> None:
             query = issue.get("issue", "") + " " + dtype + " ADGM"
             refs = retriever.search(query=query, top_k=3)
             issue["references"] = refs
+            issue["document"] = dtype
             suggestion = suggester.suggest(issue=issue, references=refs)
             if suggestion:
                 issue["suggestion"] = suggestion
-            issue["document"] = dtype
-            issue["file_name"] = name
-        all_issues.extend(issues)
+            store.add_issue(file_name=name, document=dtype, issue=issue)
 
         # Show issues in UI
         with st.expander(f"Issues in {name} ({dtype})", expanded=False):
-            if not issues:
+            rows = store.rows_for_file(name)
+            if not rows:
                 st.write("No issues found by heuristic checks.")
             else:
-                for i, iss in enumerate(issues, start=1):
-                    st.write(f"{i}. Section: {iss.get('section', 'N/A')} | Severity: {iss.get('severity', 'Medium')}")
-                    st.write(f"Issue: {iss.get('issue')}")
-                    if iss.get("suggestion"):
-                        st.write(f"Suggestion: {iss['suggestion']}")
-                    if iss.get("references"):
-                        for ref in iss["references"]:
-                            st.write(f"- Ref: {ref['title']} ({ref['source']})")
+                for i, row in enumerate(rows, start=1):
+                    st.write(f"{i}. Section: {store.sections[row]} | Severity: {store.severities[row]}")
+                    st.write(f"Issue: {store.texts[row]}")
+                    if store.suggestions[row]:
+                        st.write(f"Suggestion: {store.suggestions[row]}")
+                    for ref_id, _ in store.reference_links[row]:
+                        ref = store.references[ref_id]
+                        st.write(f"- Ref: {ref['title']} ({ref['source']})")
 
     # Build report dict
-    report_dict = build_report_dict(
+    report_args = dict(
         process=process,
         doc_types=doc_types,
         required_docs=required,
         missing_docs=missing,
-        issues=all_issues,
+    )
+    report_dict = build_report_dict(issues=store, **report_args)
+
+    info = retriever.cache_info()
+    st.sidebar.caption(
+        f"Retrieval cache: {info['hit_ratio']:.0%} hit ratio ({info['hits']}/{info['hits'] + info['misses']}), "
+        f"{info['entries']} entries, ~{info['approx_bytes'] / 1024:.1f} KiB"
     )
 
     st.subheader("Structured Output")
     st.json(report_dict)
 
-    # Generate reviewed files for download
+    # Bulk export of reviewed files plus the report, built only on request
     st.subheader("Reviewed Documents")
     timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-    for up in uploaded_files:
-        up_bytes = up.getvalue()
-        doc = load_docx_from_bytes(up_bytes)
-        issues_for_file = [i for i in all_issues if i.get("file_name") == up.name]
-        reviewed_doc = build_reviewed_docx(doc, issues_for_file)
-
-        out_bytes = io.BytesIO()
-        reviewed_doc.save(out_bytes)
-        out_bytes.seek(0)
-        download_name = f"{os.path.splitext(up.name)[0]}__reviewed__{timestamp}.docx"
+    # Any change to the uploads, process, reference index or issues invalidates the export
+    export_key = (
+        process,
+        # file_id changes on every upload, even for same-named, same-size edits
+        tuple(up.file_id for up in uploaded_files),
+        retriever.generation,
+        len(store),
+    )
+    if st.session_state.get("export_key") != export_key:
+        _drop_export()
+        st.session_state["export_key"] = export_key
+
+    if st.button("Prepare ZIP of reviewed documents and report"):
+        def reviewed_documents():
+            for up in uploaded_files:
+                doc = load_docx_from_bytes(up.getvalue())
+                yield reviewed_docx_name(up.name, timestamp), build_reviewed_docx(doc, store.for_file(up.name))
+
+        _drop_export()
+        with st.spinner("Building export..."):
+            write_report = partial(write_report_json, store=store, **report_args)
+            spool = build_review_zip(reviewed_documents(), write_report, report_name=f"adgm_corporate_agent_report_{timestamp}.json")
+        # Kept as the spooled file (on disk once large), read only to serve the download
+        st.session_state["export_zip"] = (timestamp, spool)
+
+    if "export_zip" in st.session_state:
+        export_ts, spool = st.session_state["export_zip"]
+        spool.seek(0)
         st.download_button(
-            label=f"Download reviewed: {download_name}",
-            data=out_bytes.getvalue(),
-            file_name=download_name,
-            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            label=f"Download all reviewed documents ({len(uploaded_files)} files + report, ZIP)",
+            data=spool.read(),
+            file_name=f"adgm_corporate_agent_review_{export_ts}.zip",
+            mime="application/zip",
         )
 
     # Download structured report
-    report_bytes = io.BytesIO(json.dumps(report_dict, indent=2).encode("utf-8"))
+    report_text = io.StringIO()
+    write_report_json(report_text, store=store, **report_args)
     st.download_button(
         label="Download structured report (JSON)",
-        data=report_bytes.getvalue(),
+        data=report_text.getvalue().encode("utf-8"),
         file_name=f"adgm_corporate_agent_report_{timestamp}.json",
         mime="application/json",
     )
@@ -1,13 +1,25 @@
 """Corporate Agent package for ADGM-compliant document intelligence."""
 
+import importlib
+
 __all__ = [
     "checklists",
     "doc_parser",
     "doc_classifier",
     "red_flags",
     "docx_commenter",
+    "export",
+    "issues",
     "rag",
+    "sources",
     "llm",
     "report",
 ]
 
+
+def __getattr__(name: str):
+    # Submodules are imported on first attribute access; heavy third-party
+    # dependencies are in turn imported inside the functions that use them.
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
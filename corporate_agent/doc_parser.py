@@ -1,15 +1,17 @@
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from docx import Document
+if TYPE_CHECKING:
+    from docx.document import Document
 
 
-def load_docx_from_bytes(buffer: bytes) -> Document:
+def load_docx_from_bytes(buffer: bytes) -> "Document":
     from io import BytesIO
+    import docx
 
-    return Document(BytesIO(buffer))
+    return docx.Document(BytesIO(buffer))
 
 
-def extract_full_text(doc: Document) -> str:
+def extract_full_text(doc: "Document") -> str:
     parts: List[str] = []
     for paragraph in doc.paragraphs:
         text = paragraph.text.strip()
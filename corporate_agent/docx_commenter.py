@@ -1,11 +1,13 @@
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
-from docx import Document
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+if TYPE_CHECKING:
+    from docx.document import Document
 
 
 def _add_comment(paragraph, author: str, text: str) -> None:
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
     try:
         # Create a comment range around the whole paragraph
         p = paragraph._p
@@ -44,7 +46,7 @@ def _add_comment(paragraph, author: str, text: str) -> None:
         paragraph.add_run(f"\n[Reviewer Note - {author}] {text}")
 
 
-def build_reviewed_docx(doc: Document, issues: List[Dict]) -> Document:
+def build_reviewed_docx(doc: "Document", issues: List[Dict]) -> "Document":
     if not issues:
         return doc
 
@@ -0,0 +1,83 @@
+import io
+import json
+import os
+import zipfile
+from datetime import datetime
+from tempfile import SpooledTemporaryFile
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional, TextIO, Tuple, Union
+
+if TYPE_CHECKING:
+    from docx.document import Document
+
+
+# Members that are already compressed containers gain nothing from deflate
+STORED_EXTENSIONS = (".docx", ".xlsx", ".pptx", ".zip", ".pdf", ".png", ".jpg", ".jpeg")
+
+# Keep small exports in memory; larger ones roll over to disk
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+
+def compression_for(name: str) -> int:
+    if name.lower().endswith(STORED_EXTENSIONS):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def reviewed_docx_name(file_name: str, timestamp: Optional[str] = None) -> str:
+    stem = os.path.splitext(os.path.basename(file_name))[0]
+    if timestamp:
+        return f"{stem}__reviewed__{timestamp}.docx"
+    return f"{stem}__reviewed.docx"
+
+
+def write_review_zip(
+    fileobj,
+    documents: Iterable[Tuple[str, "Document"]],
+    report: Union[Dict, Callable[[TextIO], None]],
+    report_name: str = "report.json",
+) -> None:
+    """Write reviewed documents and the JSON report into a ZIP archive.
+
+    `documents` may be a generator so that only one reviewed document is
+    serialized at a time. `report` is either a dict or a callable that
+    writes the report to a text stream; either way it is streamed straight
+    into its member.
+    """
+    with zipfile.ZipFile(fileobj, "w") as zf:
+        for name, doc in documents:
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            zf.writestr(
+                zipfile.ZipInfo(name, date_time=_zip_timestamp()),
+                buffer.getvalue(),
+                compress_type=compression_for(name),
+            )
+            buffer.close()
+
+        info = zipfile.ZipInfo(report_name, date_time=_zip_timestamp())
+        info.compress_type = compression_for(report_name)
+        with zf.open(info, "w") as member:
+            with io.TextIOWrapper(member, encoding="utf-8") as text:
+                if callable(report):
+                    report(text)
+                else:
+                    json.dump(report, text, indent=2)
+
+
+def build_review_zip(
+    documents: Iterable[Tuple[str, "Document"]],
+    report: Union[Dict, Callable[[TextIO], None]],
+    report_name: str = "report.json",
+    max_size: int = SPOOL_MAX_SIZE,
+) -> SpooledTemporaryFile:
+    """Build the export in a spooled temp file, rewound and ready to read."""
+    spool = SpooledTemporaryFile(max_size=max_size, mode="w+b")
+    write_review_zip(spool, documents, report, report_name=report_name)
+    spool.seek(0)
+    return spool
+
+
+def _zip_timestamp() -> Tuple[int, int, int, int, int, int]:
+    # ZIP member times are interpreted as local time
+    now = datetime.now()
+    return (now.year, now.month, now.day, now.hour, now.minute, now.second)
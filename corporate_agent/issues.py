@@ -0,0 +1,137 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class IssueStore:
+    """Columnar store for review issues.
+
+    Each issue is a row index into parallel column lists. Reference
+    snippets are interned once in `references` and issues point at them by
+    ID with their per-query score, so a report stays small however many
+    issues cite the same source. Per-file and per-severity indexes make
+    grouping linear in the number of issues.
+    """
+
+    __slots__ = (
+        "file_names",
+        "documents",
+        "sections",
+        "texts",
+        "severities",
+        "suggestions",
+        "reference_links",
+        "references",
+        "_ref_ids",
+        "_by_file",
+        "_by_severity",
+    )
+
+    def __init__(self) -> None:
+        self.file_names: List[str] = []
+        self.documents: List[str] = []
+        self.sections: List[str] = []
+        self.texts: List[str] = []
+        self.severities: List[str] = []
+        self.suggestions: List[Optional[str]] = []
+        self.reference_links: List[Tuple[Tuple[int, float], ...]] = []
+        self.references: List[Dict] = []
+        self._ref_ids: Dict[Tuple[str, str], int] = {}
+        self._by_file: Dict[str, List[int]] = {}
+        self._by_severity: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def intern_reference(self, ref: Dict) -> int:
+        key = (ref.get("source", ""), ref.get("title", ""))
+        ref_id = self._ref_ids.get(key)
+        if ref_id is None:
+            ref_id = len(self.references)
+            self._ref_ids[key] = ref_id
+            self.references.append({
+                "id": ref_id,
+                "title": ref.get("title", ""),
+                "source": ref.get("source", ""),
+                "snippet": ref.get("snippet", ""),
+            })
+        return ref_id
+
+    def add(
+        self,
+        file_name: str,
+        document: str,
+        section: str,
+        issue: str,
+        severity: str = "Medium",
+        suggestion: Optional[str] = None,
+        references: Optional[List[Dict]] = None,
+    ) -> int:
+        row = len(self.texts)
+        self.file_names.append(file_name)
+        self.documents.append(document)
+        self.sections.append(section)
+        self.texts.append(issue)
+        self.severities.append(severity)
+        self.suggestions.append(suggestion)
+        self.reference_links.append(tuple(
+            (self.intern_reference(r), float(r.get("score", 0.0))) for r in references or []
+        ))
+        self._by_file.setdefault(file_name, []).append(row)
+        self._by_severity.setdefault(severity, []).append(row)
+        return row
+
+    def add_issue(self, file_name: str, document: str, issue: Dict) -> int:
+        """Add a red-flag issue dict as produced by `detect_red_flags`."""
+        return self.add(
+            file_name=file_name,
+            document=document,
+            section=issue.get("section", "N/A"),
+            issue=issue.get("issue", ""),
+            severity=issue.get("severity", "Medium"),
+            suggestion=issue.get("suggestion"),
+            references=issue.get("references"),
+        )
+
+    def files(self) -> List[str]:
+        return list(self._by_file)
+
+    def rows_for_file(self, file_name: str) -> Tuple[int, ...]:
+        return tuple(self._by_file.get(file_name, ()))
+
+    def rows_for_severity(self, severity: str) -> Tuple[int, ...]:
+        return tuple(self._by_severity.get(severity, ()))
+
+    def severity_counts(self) -> Dict[str, int]:
+        return {sev: len(rows) for sev, rows in self._by_severity.items()}
+
+    def row(self, i: int) -> Dict:
+        """Compact row: references are given as {"id", "score"} pairs."""
+        out = {
+            "document": self.documents[i],
+            "file_name": self.file_names[i],
+            "section": self.sections[i],
+            "issue": self.texts[i],
+            "severity": self.severities[i],
+        }
+        if self.suggestions[i]:
+            out["suggestion"] = self.suggestions[i]
+        out["references"] = [{"id": ref_id, "score": score} for ref_id, score in self.reference_links[i]]
+        return out
+
+    def expanded(self, i: int) -> Dict:
+        """Row with full reference dicts, as expected by `build_reviewed_docx`."""
+        out = self.row(i)
+        out["references"] = [
+            dict(self.references[ref_id], score=score) for ref_id, score in self.reference_links[i]
+        ]
+        return out
+
+    def rows(self) -> Iterator[Dict]:
+        for i in range(len(self.texts)):
+            yield self.row(i)
+
+    def for_file(self, file_name: str) -> List[Dict]:
+        return [self.expanded(i) for i in self._by_file.get(file_name, ())]
+
+    def reference_table(self) -> List[Dict]:
+        """Copies of the interned references, safe for callers to mutate."""
+        return [dict(ref) for ref in self.references]
@@ -1,25 +1,58 @@
 import os
+import threading
 from typing import Dict, List, Optional
 
-from dotenv import load_dotenv
+_ENV_LOADED = False
+_ENV_LOCK = threading.Lock()
 
-load_dotenv()
+
+def _load_env() -> None:
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    with _ENV_LOCK:
+        if _ENV_LOADED:
+            return
+        try:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+        except ImportError:
+            pass
+        _ENV_LOADED = True
 
 
 class ClauseSuggester:
     def __init__(self) -> None:
         # Placeholder: try to use OpenAI if key provided; otherwise return heuristic suggestions
+        _load_env()
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         self.api_key = os.getenv("OPENAI_API_KEY")
-        try:
-            if self.api_key:
-                from openai import OpenAI  # type: ignore
+        self._client = None
+        self._client_loaded = False
+        # The suggester is shared across Streamlit sessions
+        self._client_lock = threading.Lock()
 
-                self.client = OpenAI(api_key=self.api_key)
-            else:
-                self.client = None
-        except Exception:
-            self.client = None
+    @property
+    def client(self):
+        # The openai SDK is imported on the first suggestion that needs it.
+        # The flag is set only after _client is assigned, so no thread sees
+        # a half-initialized suggester and falls back to heuristics.
+        if self._client_loaded:
+            return self._client
+        with self._client_lock:
+            if not self._client_loaded:
+                client = None
+                try:
+                    if self.api_key:
+                        from openai import OpenAI  # type: ignore
+
+                        client = OpenAI(api_key=self.api_key)
+                except Exception:
+                    client = None
+                self._client = client
+                self._client_loaded = True
+        return self._client
 
     def suggest(self, issue: Dict, references: List[Dict]) -> Optional[str]:
         prompt = (
@@ -1,10 +1,9 @@
 import os
+import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List
-
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -14,15 +13,78 @@ class ReferenceDoc:
     source: str
 
 
+@dataclass(frozen=True)
+class _Index:
+    """Immutable snapshot of the reference index.
+
+    Writers build and fit a new snapshot, then swap the reference; readers
+    hold on to the snapshot they started with and never block or fit.
+    """
+
+    docs: Tuple[ReferenceDoc, ...]
+    generation: int
+    vectorizer: Optional[Any] = None
+    matrix: Optional[Any] = None
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def _results_size(results: List[Dict]) -> int:
+    size = sys.getsizeof(results)
+    for r in results:
+        size += sys.getsizeof(r) + sum(sys.getsizeof(v) for v in r.values())
+    return size
+
+
 class Retriever:
-    def __init__(self, reference_dir: str) -> None:
+    def __init__(self, reference_dir: str, cache_size: int = 1024) -> None:
         self.reference_dir = reference_dir
-        self.docs: List[ReferenceDoc] = self._load_references(reference_dir)
-        corpus = [d.text for d in self.docs]
-        if not corpus:
-            corpus = [""]
-        self.vectorizer = TfidfVectorizer(stop_words="english")
-        self.matrix = self.vectorizer.fit_transform(corpus)
+        self.cache_size = cache_size
+        # Serializes writers (init, reload, extend_with); searches never take it
+        self._write_lock = threading.Lock()
+        # Guards the LRU and its counters
+        self._cache_lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[str, int, int], Tuple[List[Dict], int]]" = OrderedDict()
+        self._cache_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._index = _Index(docs=(), generation=0)
+        with self._write_lock:
+            self._swap_index(self._load_references(reference_dir))
+
+    @property
+    def docs(self) -> Tuple[ReferenceDoc, ...]:
+        return self._index.docs
+
+    @property
+    def generation(self) -> int:
+        # Bumped whenever the index changes; part of every cache key
+        return self._index.generation
+
+    @property
+    def vectorizer(self):
+        return self._index.vectorizer
+
+    @property
+    def matrix(self):
+        return self._index.matrix
+
+    def _swap_index(self, docs: List[ReferenceDoc]) -> None:
+        # Caller holds _write_lock. The new snapshot is fully fitted before
+        # it is published, so readers only ever see complete indexes.
+        self._index = self._fit(docs, generation=self._index.generation + 1)
+        with self._cache_lock:
+            # Entries from older generations can never hit again
+            self._cache.clear()
+            self._cache_bytes = 0
+
+    def reload(self) -> None:
+        """Re-read the reference directory and rebuild the index."""
+        docs = self._load_references(self.reference_dir)
+        with self._write_lock:
+            self._swap_index(docs)
 
     def _load_references(self, ref_dir: str) -> List[ReferenceDoc]:
         docs: List[ReferenceDoc] = []
@@ -43,14 +105,67 @@ class Retriever:
         return docs
 
     def search(self, query: str, top_k: int = 3) -> List[Dict]:
-        if not self.docs:
+        index = self._index
+        if not index.docs:
             return []
-        q_vec = self.vectorizer.transform([query])
-        sims = cosine_similarity(q_vec, self.matrix).flatten()
+        key = (_normalize_query(query), top_k, index.generation)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._hits += 1
+                self._cache.move_to_end(key)
+            else:
+                self._misses += 1
+        if cached is not None:
+            return [dict(r) for r in cached[0]]
+
+        results = self._search_uncached(index, query, top_k)
+        if self.cache_size > 0:
+            size = _results_size(results)
+            with self._cache_lock:
+                # Don't let a search that raced an index swap repopulate the
+                # cache, or count a concurrent miss on the same key twice
+                if index.generation == self._index.generation and key not in self._cache:
+                    self._cache[key] = (results, size)
+                    self._cache_bytes += size
+                    while len(self._cache) > self.cache_size:
+                        _, (_, evicted) = self._cache.popitem(last=False)
+                        self._cache_bytes -= evicted
+        return [dict(r) for r in results]
+
+    def cache_info(self) -> Dict:
+        with self._cache_lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "entries": len(self._cache),
+                "max_entries": self.cache_size,
+                "approx_bytes": self._cache_bytes,
+                "generation": self.generation,
+            }
+
+    def _fit(self, docs: List[ReferenceDoc], generation: int) -> _Index:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        corpus = [d.text for d in docs]
+        if not corpus:
+            corpus = [""]
+        vectorizer = TfidfVectorizer(stop_words="english")
+        matrix = vectorizer.fit_transform(corpus)
+        return _Index(docs=tuple(docs), generation=generation, vectorizer=vectorizer, matrix=matrix)
+
+    def _search_uncached(self, index: _Index, query: str, top_k: int) -> List[Dict]:
+        import numpy as np
+        from sklearn.metrics.pairwise import cosine_similarity
+
+        q_vec = index.vectorizer.transform([query])
+        sims = cosine_similarity(q_vec, index.matrix).flatten()
         top_idx = np.argsort(-sims)[:top_k]
         results: List[Dict] = []
         for i in top_idx:
-            d = self.docs[int(i)]
+            d = index.docs[int(i)]
             snippet = d.text[:240].replace("\n", " ")
             results.append({
                 "title": d.title,
@@ -61,14 +176,18 @@ class Retriever:
         return results
 
     def extend_with(self, extra: List[Dict]) -> None:
-        # Add extra reference docs dynamically (e.g., from URLs)
+        # Add extra reference docs dynamically (e.g., from URLs). The new
+        # snapshot is built from a copy, so concurrent searches are unaffected.
+        added: List[ReferenceDoc] = []
         for e in extra:
             title = e.get("title", "External")
             text = e.get("text", "")
             source = e.get("source", "")
             if not text:
                 continue
-            self.docs.append(ReferenceDoc(title=title, text=text, source=source))
-        corpus = [d.text for d in self.docs] or [""]
-        self.matrix = self.vectorizer.fit_transform(corpus)
-
+            added.append(ReferenceDoc(title=title, text=text, source=source))
+        if not added:
+            # Nothing new to index; keep the current generation and cache
+            return
+        with self._write_lock:
+            self._swap_index(list(self._index.docs) + added)
@@ -1,18 +1,89 @@
-from typing import Dict, List
+import json
+from typing import Dict, Iterator, List, TextIO, Union
 
+from corporate_agent.issues import IssueStore
 
-def build_report_dict(
+
+def _report_header(
     process: str,
     doc_types: Dict[str, str],
     required_docs: List[str],
     missing_docs: List[str],
-    issues: List[Dict],
 ) -> Dict:
     return {
         "process": process,
         "documents_uploaded": len(set(doc_types.values())),
         "required_documents": len(required_docs),
         "missing_documents": missing_docs,
-        "issues_found": issues,
     }
 
+
+def build_report_dict(
+    process: str,
+    doc_types: Dict[str, str],
+    required_docs: List[str],
+    missing_docs: List[str],
+    issues: Union[List[Dict], IssueStore],
+) -> Dict:
+    report = _report_header(process, doc_types, required_docs, missing_docs)
+    if isinstance(issues, IssueStore):
+        report["references"] = issues.reference_table()
+        report["issues_found"] = list(issues.rows())
+    else:
+        report["issues_found"] = issues
+    return report
+
+
+def iter_report_json(
+    process: str,
+    doc_types: Dict[str, str],
+    required_docs: List[str],
+    missing_docs: List[str],
+    store: IssueStore,
+    indent: int = 2,
+) -> Iterator[str]:
+    """Yield the compact report as JSON text, one reference/issue at a time."""
+    pad = " " * indent
+    header = _report_header(process, doc_types, required_docs, missing_docs)
+    yield "{"
+    for key, value in header.items():
+        yield f"\n{pad}{json.dumps(key)}: {json.dumps(value)},"
+    for key, items in (("references", iter(store.references)), ("issues_found", store.rows())):
+        yield f"\n{pad}{json.dumps(key)}: ["
+        sep = ""
+        for item in items:
+            yield f"{sep}\n{pad}{pad}{json.dumps(item)}"
+            sep = ","
+        yield f"\n{pad}]" + ("," if key == "references" else "")
+    yield "\n}\n"
+
+
+def write_report_json(
+    fp: TextIO,
+    process: str,
+    doc_types: Dict[str, str],
+    required_docs: List[str],
+    missing_docs: List[str],
+    store: IssueStore,
+    indent: int = 2,
+) -> None:
+    """Stream the compact report from `iter_report_json` into a text file object."""
+    for chunk in iter_report_json(process, doc_types, required_docs, missing_docs, store, indent=indent):
+        fp.write(chunk)
+
+
+def write_report_jsonl(
+    fp: TextIO,
+    process: str,
+    doc_types: Dict[str, str],
+    required_docs: List[str],
+    missing_docs: List[str],
+    store: IssueStore,
+) -> None:
+    """Write one JSON object per line: a header, then references, then issues."""
+    header = _report_header(process, doc_types, required_docs, missing_docs)
+    fp.write(json.dumps(dict(header, type="header", issue_counts=store.severity_counts())) + "\n")
+    for ref in store.references:
+        fp.write(json.dumps(dict(ref, type="reference")) + "\n")
+    for row in store.rows():
+        fp.write(json.dumps(dict(row, type="issue")) + "\n")
@@ -1,8 +1,5 @@
 import os
-from typing import Dict, List, Optional
-
-import requests
-from bs4 import BeautifulSoup
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
 def _safe_filename(url: str) -> str:
@@ -11,14 +8,48 @@ def _safe_filename(url: str) -> str:
     return name[:120]
 
 
-def _extract_html_text(content: bytes) -> str:
-    soup = BeautifulSoup(content, "html.parser")
+_STRIPPED_TAGS = ["script", "style", "nav", "header", "footer"]
+
+
+def _clean_lines(text: str) -> str:
+    return "\n".join(line for line in (l.strip() for l in text.splitlines()) if line)
+
+
+def html_backend() -> str:
+    """Name of the HTML extractor in use: selectolax, lxml or html.parser."""
+    try:
+        import selectolax.lexbor  # type: ignore  # noqa: F401
+
+        return "selectolax"
+    except ImportError:
+        pass
+    try:
+        import lxml  # type: ignore  # noqa: F401
+
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+
+def extract_html_text(content: bytes) -> str:
+    backend = html_backend()
+    # Both backends take text from the whole document (head included)
+    if backend == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser  # type: ignore
+
+        tree = LexborHTMLParser(content)
+        for node in tree.css(", ".join(_STRIPPED_TAGS)):
+            node.decompose()
+        root = tree.root
+        return _clean_lines(root.text(separator="\n")) if root is not None else ""
+
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, backend)
     # Remove script/style
-    for tag in soup(["script", "style", "nav", "header", "footer"]):
+    for tag in soup(_STRIPPED_TAGS):
         tag.extract()
-    text = soup.get_text(separator="\n")
-    lines = [l.strip() for l in text.splitlines()]
-    return "\n".join([l for l in lines if l])
+    return _clean_lines(soup.get_text(separator="\n"))
 
 
 def _extract_docx_text(content: bytes) -> str:
@@ -36,25 +67,121 @@ def _extract_docx_text(content: bytes) -> str:
         return ""
 
 
-def _extract_pdf_text(content: bytes) -> str:
+# Spawned workers each start an interpreter, import pypdf and re-parse the
+# PDF: about 0.25s per worker, against roughly 12ms per text page when
+# extracting serially. Parallel extraction only pays off on long documents,
+# so it needs both this many pages and an estimated saving (from timing
+# the first SAMPLE_PAGES in-process) of at least twice the startup cost.
+PARALLEL_MIN_PAGES = 64
+SAMPLE_PAGES = 4
+WORKER_STARTUP_SECONDS = 0.25
+
+# Per-worker reader, parsed once from the bytes handed to the pool initializer
+_WORKER_READER = None
+
+
+def _extract_page(reader, i: int) -> str:
+    try:
+        return reader.pages[i].extract_text() or ""
+    except Exception:
+        return ""
+
+
+def _init_pdf_worker(content: bytes) -> None:
+    global _WORKER_READER
+    from io import BytesIO
+    from pypdf import PdfReader  # type: ignore
+
+    _WORKER_READER = PdfReader(BytesIO(content))
+
+
+def _extract_pdf_page_range(start: int, stop: int) -> List[str]:
+    return [_extract_page(_WORKER_READER, i) for i in range(start, stop)]
+
+
+def pdf_workers(num_pages: int, seconds_per_page: float, workers: Optional[int] = None) -> int:
+    """Number of worker processes worth using for the remaining pages; 1 means serial."""
+    cpus = os.cpu_count() or 1
+    workers = min(workers or cpus, cpus, num_pages)
+    if workers <= 1 or num_pages < PARALLEL_MIN_PAGES:
+        return 1
+    saving = num_pages * seconds_per_page * (1 - 1 / workers)
+    if saving < 2 * WORKER_STARTUP_SECONDS:
+        return 1
+    return workers
+
+
+def iter_pdf_pages(content: bytes, workers: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+    """Yield (page_number, text) for each PDF page, 1-based and in order.
+
+    The first pages are extracted in-process to estimate the per-page
+    cost. If `pdf_workers` judges it worthwhile, the rest is split into one
+    page range per worker process; each worker receives the bytes once and
+    parses them once. A range whose worker fails is re-extracted here.
+    """
+    import time
+
     try:
         from io import BytesIO
         from pypdf import PdfReader  # type: ignore
 
         reader = PdfReader(BytesIO(content))
-        pages: List[str] = []
-        for page in reader.pages:
-            pages.append(page.extract_text() or "")
-        return "\n".join(pages)
+        num_pages = len(reader.pages)
     except Exception:
-        return ""
-
-
-def fetch_urls(urls: List[str], save_dir: Optional[str] = None) -> List[Dict]:
+        return
+
+    sampled = min(SAMPLE_PAGES, num_pages)
+    started = time.perf_counter()
+    for i in range(sampled):
+        yield i + 1, _extract_page(reader, i)
+    per_page = (time.perf_counter() - started) / max(sampled, 1)
+
+    remaining = num_pages - sampled
+    workers = pdf_workers(remaining, per_page, workers)
+    if workers <= 1:
+        for i in range(sampled, num_pages):
+            yield i + 1, _extract_page(reader, i)
+        return
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    step = -(-remaining // workers)
+    ranges = [(i, min(i + step, num_pages)) for i in range(sampled, num_pages, step)]
+    # spawn, not fork: this runs inside Streamlit's multithreaded server
+    with ProcessPoolExecutor(
+        max_workers=len(ranges),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_pdf_worker,
+        initargs=(content,),
+    ) as pool:
+        futures = []
+        for start, stop in ranges:
+            try:
+                futures.append(pool.submit(_extract_pdf_page_range, start, stop))
+            except Exception:
+                futures.append(None)
+        for (start, stop), future in zip(ranges, futures):
+            try:
+                if future is None:
+                    raise RuntimeError("range was never submitted")
+                pages = future.result()
+            except Exception:
+                # Broken pool, killed worker or failed bootstrap: don't lose the pages
+                pages = [_extract_page(reader, i) for i in range(start, stop)]
+            for offset, text in enumerate(pages):
+                yield start + offset + 1, text
+
+
+def fetch_urls(urls: List[str], save_dir: Optional[str] = None, split_pages: bool = False) -> List[Dict]:
     """Fetch URLs and extract text content. Returns a list of reference docs.
 
-    Each entry: {"title": str, "text": str, "source": str}
+    Each entry: {"title": str, "text": str, "source": str}. With
+    `split_pages`, PDFs produce one entry per non-empty page, with an extra
+    "page" key and a "#page=N" source fragment.
     """
+    import requests
+
     results: List[Dict] = []
     if save_dir:
         os.makedirs(save_dir, exist_ok=True)
@@ -65,24 +192,34 @@ def fetch_urls(urls: List[str], save_dir: Optional[str] = None) -> List[Dict]:
             resp.raise_for_status()
             content_type = resp.headers.get("content-type", "").lower()
             text = ""
-            if "text/html" in content_type:
-                text = _extract_html_text(resp.content)
-            elif "/pdf" in content_type:
-                text = _extract_pdf_text(resp.content)
+            if "/pdf" in content_type:
+                pages = []
+                for page_no, page_text in iter_pdf_pages(resp.content):
+                    pages.append(page_text)
+                    if split_pages and page_text.strip():
+                        results.append({
+                            "title": f"{url} (p. {page_no})",
+                            "text": page_text,
+                            "source": f"{url}#page={page_no}",
+                            "page": page_no,
+                        })
+                text = "\n".join(pages)
+            elif "text/html" in content_type:
+                text = extract_html_text(resp.content)
             elif "application/vnd.openxmlformats-officedocument.wordprocessingml.document" in content_type or url.lower().endswith(".docx"):
                 text = _extract_docx_text(resp.content)
             else:
                 # Try as HTML fallback
-                text = _extract_html_text(resp.content)
+                text = extract_html_text(resp.content)
 
             title = url
             if save_dir:
                 fname = _safe_filename(url)
                 with open(os.path.join(save_dir, f"{fname}.txt"), "w", encoding="utf-8") as f:
                     f.write(text)
-            results.append({"title": title, "text": text, "source": url})
+            if not (split_pages and "/pdf" in content_type):
+                results.append({"title": title, "text": text, "source": url})
         except Exception:
             continue
 
     return results
-
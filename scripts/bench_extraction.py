@@ -0,0 +1,56 @@
+import time
+from pathlib import Path
+
+import typer
+
+from corporate_agent.sources import extract_html_text, html_backend, iter_pdf_pages, pdf_workers
+
+
+app = typer.Typer()
+
+
+@app.command()
+def bench(folder: str, workers: int = 0, repeat: int = 1) -> None:
+    """Time PDF page extraction (serial vs parallel) and HTML extraction on local fixtures."""
+    folder_path = Path(folder)
+    pdfs = sorted(folder_path.glob("*.pdf"))
+    htmls = sorted(list(folder_path.glob("*.html")) + list(folder_path.glob("*.htm")))
+
+    for file in pdfs:
+        content = file.read_bytes()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            pages = sum(1 for _ in iter_pdf_pages(content, workers=1))
+        serial = (time.perf_counter() - start) / repeat
+        print(f"{file.name} [serial]: {pages} pages in {serial:.2f}s ({pages / max(serial, 1e-9):.1f} pages/s)")
+
+        effective = pdf_workers(pages, serial / max(pages, 1), workers or None)
+        if effective <= 1:
+            print(f"{file.name} [parallel]: skipped, iter_pdf_pages would run serially (effective workers: 1)")
+            continue
+        start = time.perf_counter()
+        for _ in range(repeat):
+            pages = sum(1 for _ in iter_pdf_pages(content, workers=workers or None))
+        elapsed = (time.perf_counter() - start) / repeat
+        print(
+            f"{file.name} [parallel, {effective} workers]: {pages} pages in {elapsed:.2f}s "
+            f"({pages / max(elapsed, 1e-9):.1f} pages/s, {serial / max(elapsed, 1e-9):.2f}x serial)"
+        )
+
+    if htmls:
+        print(f"HTML backend: {html_backend()}")
+    for file in htmls:
+        content = file.read_bytes()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            text = extract_html_text(content)
+        elapsed = (time.perf_counter() - start) / repeat
+        mb = len(content) / (1024 * 1024)
+        print(f"{file.name}: {mb:.2f} MB -> {len(text)} chars in {elapsed:.3f}s ({mb / max(elapsed, 1e-9):.1f} MB/s)")
+
+    if not pdfs and not htmls:
+        print(f"No .pdf or .html fixtures found in {folder_path.resolve()}")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,98 @@
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+import typer
+
+
+app = typer.Typer()
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# `review_folder` is the headless CLI entry point (scripts/ is put on the path)
+DEFAULT_MODULES = [
+    "review_folder",
+    "corporate_agent.checklists",
+    "corporate_agent.doc_parser",
+    "corporate_agent.doc_classifier",
+    "corporate_agent.red_flags",
+    "corporate_agent.docx_commenter",
+    "corporate_agent.export",
+    "corporate_agent.issues",
+    "corporate_agent.rag",
+    "corporate_agent.sources",
+    "corporate_agent.llm",
+    "corporate_agent.report",
+]
+
+# What corporate_agent used to import at module load, before lazy loading
+EAGER_IMPORTS = (
+    "import numpy, sklearn.feature_extraction.text, sklearn.metrics.pairwise, requests, bs4, "
+    "docx, docx.oxml, dotenv; dotenv.load_dotenv()"
+)
+
+# Third-party packages that should only load when their feature is used
+HEAVY_PACKAGES = ["sklearn", "numpy", "bs4", "requests", "docx", "dotenv", "openai", "pypdf"]
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _importtime(statement: str) -> Tuple[int, Dict[str, int]]:
+    """Run `statement` under -X importtime; return total µs and heavy packages loaded."""
+    path = [os.getcwd(), SCRIPTS_DIR, os.environ.get("PYTHONPATH")]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, path)))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if proc.returncode != 0:
+        print(f"Failed to run {statement!r}:\n{proc.stderr}", file=sys.stderr)
+        raise typer.Exit(1)
+    total = 0
+    packages: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        if indent == 1:
+            total += cumulative
+        top = name.split(".")[0]
+        if top in HEAVY_PACKAGES:
+            packages[top] = max(packages.get(top, 0), cumulative)
+    return total, packages
+
+
+def _best(statement: str, repeat: int) -> Tuple[int, Dict[str, int]]:
+    runs = [_importtime(statement) for _ in range(repeat)]
+    return min(runs, key=lambda r: r[0])
+
+
+@app.command()
+def bench(modules: List[str] = typer.Argument(None), repeat: int = 5) -> None:
+    """Report import time of the CLI and corporate_agent modules, lazy vs. eager.
+
+    Interpreter startup (`python -c pass`) is subtracted. The eager column
+    adds the heavy imports the package used to perform at module load.
+    """
+    baseline, _ = _best("pass", repeat)
+    print(f"Interpreter baseline: {baseline / 1000:.1f} ms (subtracted below)")
+    for module in modules or DEFAULT_MODULES:
+        lazy, heavy = _best(f"import {module}", repeat)
+        eager, _ = _best(f"import {module}; {EAGER_IMPORTS}", repeat)
+        lazy_ms = max(lazy - baseline, 0) / 1000
+        eager_ms = max(eager - baseline, 0) / 1000
+        # Sub-millisecond differences are within run-to-run noise
+        ratio = f"{eager_ms / lazy_ms:.1f}x faster" if lazy_ms >= 1 else "lazy cost within noise"
+        print(
+            f"{module}: {lazy_ms:.1f} ms lazy vs {eager_ms:.1f} ms eager ({ratio}); "
+            f"heavy deps loaded: {', '.join(sorted(heavy)) or 'none'}"
+        )
+
+
+if __name__ == "__main__":
+    app()
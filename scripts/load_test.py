@@ -0,0 +1,254 @@
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from typing import Dict, List
+
+import typer
+
+from corporate_agent.doc_parser import extract_full_text, load_docx_from_bytes
+from corporate_agent.doc_classifier import classify_document_type
+from corporate_agent.red_flags import detect_red_flags
+from corporate_agent.docx_commenter import build_reviewed_docx
+from corporate_agent.export import reviewed_docx_name, write_review_zip
+from corporate_agent.checklists import infer_process_from_documents, REQUIRED_DOCUMENTS_BY_PROCESS
+from corporate_agent.rag import Retriever
+from corporate_agent.llm import ClauseSuggester
+from corporate_agent.issues import IssueStore
+from corporate_agent.report import write_report_json
+
+
+app = typer.Typer()
+
+QUERIES = [
+    "Jurisdiction clause does not specify ADGM",
+    "Ambiguous or non-binding language detected",
+    "Missing signatory/execution section",
+    "Document appears unusually short; check template completeness",
+    "AoA missing reference to share capital",
+]
+
+
+class _Sink:
+    """Write-only file object that discards data (stands in for a download)."""
+
+    def __init__(self) -> None:
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def _rss_bytes() -> int:
+    """Current resident set size, or peak RSS where no current source exists."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil  # type: ignore
+
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _rss_label() -> str:
+    if os.path.exists("/proc/self/statm"):
+        return "rss"
+    try:
+        import psutil  # type: ignore  # noqa: F401
+
+        return "rss"
+    except ImportError:
+        return "peak rss"
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.memory: List[tuple] = []
+
+    def record(self, op: str, seconds: float) -> None:
+        with self.lock:
+            self.latencies.setdefault(op, []).append(seconds)
+
+    def error(self, op: str) -> None:
+        with self.lock:
+            self.errors[op] = self.errors.get(op, 0) + 1
+
+
+def _review_upload(files: Dict[str, bytes], retriever: Retriever, suggester: ClauseSuggester) -> None:
+    """One analyst session: the same steps `app.main` runs for an upload set."""
+    doc_types: Dict[str, str] = {}
+    doc_texts: Dict[str, str] = {}
+    for name, data in files.items():
+        text = extract_full_text(load_docx_from_bytes(data))
+        doc_texts[name] = text
+        doc_types[name] = classify_document_type(text)
+
+    process = infer_process_from_documents(list(doc_types.values()))
+    required = REQUIRED_DOCUMENTS_BY_PROCESS.get(process, [])
+    missing = [r for r in required if r not in set(doc_types.values())]
+
+    store = IssueStore()
+    for name, text in doc_texts.items():
+        dtype = doc_types[name]
+        for issue in detect_red_flags(dtype, text):
+            refs = retriever.search(query=issue.get("issue", "") + " " + dtype + " ADGM", top_k=3)
+            issue["references"] = refs
+            issue["document"] = dtype
+            suggestion = suggester.suggest(issue=issue, references=refs)
+            if suggestion:
+                issue["suggestion"] = suggestion
+            store.add_issue(file_name=name, document=dtype, issue=issue)
+
+    def reviewed_documents():
+        for name, data in files.items():
+            yield reviewed_docx_name(name), build_reviewed_docx(load_docx_from_bytes(data), store.for_file(name))
+
+    report = partial(
+        write_report_json,
+        process=process,
+        doc_types=doc_types,
+        required_docs=required,
+        missing_docs=missing,
+        store=store,
+    )
+    write_review_zip(_Sink(), reviewed_documents(), report)
+
+
+def _search(retriever: Retriever, rng: random.Random) -> None:
+    top_k = rng.choice([1, 3, 5])
+    results = retriever.search(query=rng.choice(QUERIES) + " ADGM", top_k=top_k)
+    if len(results) > top_k or any(not r.get("source") for r in results):
+        raise AssertionError("inconsistent search result")
+
+
+def _extend(retriever: Retriever, rng: random.Random, max_docs: int) -> None:
+    if len(retriever.docs) >= max_docs:
+        retriever.reload()
+        return
+    n = rng.randint(1, 5)
+    retriever.extend_with([
+        {
+            "title": f"Synthetic reference {rng.getrandbits(32):08x}",
+            "text": " ".join(rng.choice(QUERIES) for _ in range(20)),
+            "source": "load-test",
+        }
+        for _ in range(n)
+    ])
+
+
+@app.command()
+def run(
+    folder: str = "examples",
+    sessions: int = 8,
+    duration: float = 30.0,
+    upload_weight: int = 2,
+    search_weight: int = 10,
+    extend_weight: int = 1,
+    max_docs: int = 200,
+    sample_every: float = 1.0,
+    seed: int = 0,
+) -> None:
+    """Drive the review pipeline from concurrent sessions sharing one Retriever and ClauseSuggester.
+
+    Like Streamlit sessions, each simulated session is a thread using the
+    same shared objects that `@st.cache_resource` hands out.
+    """
+    files = {p.name: p.read_bytes() for p in sorted(Path(folder).glob("*.docx"))}
+    if not files:
+        raise typer.BadParameter(f"No .docx files in {folder}")
+
+    retriever = Retriever(reference_dir="data/reference")
+    suggester = ClauseSuggester()
+    stats = Stats()
+    stop = threading.Event()
+
+    ops = ["upload", "search", "extend"]
+    weights = [upload_weight, search_weight, extend_weight]
+
+    def session(i: int) -> None:
+        rng = random.Random(seed + i)
+        while not stop.is_set():
+            op = rng.choices(ops, weights)[0]
+            start = time.perf_counter()
+            try:
+                if op == "upload":
+                    _review_upload(files, retriever, suggester)
+                elif op == "search":
+                    _search(retriever, rng)
+                else:
+                    _extend(retriever, rng, max_docs)
+            except Exception:
+                stats.error(op)
+                continue
+            stats.record(op, time.perf_counter() - start)
+
+    def sampler() -> None:
+        began = time.perf_counter()
+        while not stop.wait(sample_every):
+            stats.memory.append((time.perf_counter() - began, _rss_bytes(), len(retriever.docs)))
+
+    threads = [threading.Thread(target=session, args=(i,), daemon=True) for i in range(sessions)]
+    threads.append(threading.Thread(target=sampler, daemon=True))
+    rss_start = _rss_bytes()
+    began = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - began
+
+    total = sum(len(v) for v in stats.latencies.values())
+    print(f"{sessions} sessions, {elapsed:.1f}s, {total} ops ({total / elapsed:.1f} ops/s)")
+    for op in ops:
+        lat = stats.latencies.get(op, [])
+        if not lat and not stats.errors.get(op):
+            continue
+        print(
+            f"  {op:<7} n={len(lat):<6} {len(lat) / elapsed:7.1f}/s  "
+            f"p50={_percentile(lat, 50) * 1000:7.1f}ms  p95={_percentile(lat, 95) * 1000:7.1f}ms  "
+            f"p99={_percentile(lat, 99) * 1000:7.1f}ms  max={max(lat, default=0) * 1000:7.1f}ms  "
+            f"mean={statistics.fmean(lat) * 1000 if lat else 0:7.1f}ms  errors={stats.errors.get(op, 0)}"
+        )
+
+    info = retriever.cache_info()
+    print(
+        f"Retrieval cache: {info['hit_ratio']:.0%} hit ratio, {info['entries']} entries, "
+        f"generation {info['generation']}"
+    )
+    label = _rss_label()
+    print(f"Memory ({label}): start {rss_start / 2**20:.1f} MiB, end {_rss_bytes() / 2**20:.1f} MiB")
+    for t, rss, ndocs in stats.memory[:: max(1, len(stats.memory) // 10)]:
+        print(f"  t={t:6.1f}s  {label}={rss / 2**20:7.1f} MiB  index_docs={ndocs}")
+
+
+if __name__ == "__main__":
+    app()
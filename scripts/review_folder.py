@@ -1,35 +1,42 @@
 import io
-import json
+from functools import partial
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict
 
 import typer
-from docx import Document
 
-from corporate_agent.doc_parser import extract_full_text
+from corporate_agent.doc_parser import extract_full_text, load_docx_from_bytes
 from corporate_agent.doc_classifier import classify_document_type
 from corporate_agent.red_flags import detect_red_flags
 from corporate_agent.docx_commenter import build_reviewed_docx
+from corporate_agent.export import reviewed_docx_name, write_review_zip
 from corporate_agent.checklists import infer_process_from_documents, REQUIRED_DOCUMENTS_BY_PROCESS
 from corporate_agent.rag import Retriever
-from corporate_agent.report import build_report_dict
+from corporate_agent.issues import IssueStore
+from corporate_agent.report import write_report_json, write_report_jsonl
 
 
 app = typer.Typer()
 
 
 @app.command()
-def review(folder: str, out: str = "out") -> None:
+def review(
+    folder: str,
+    out: str = "out",
+    zip_output: bool = typer.Option(False, "--zip", help="Write a single ZIP of reviewed docs and report."),
+    refs: bool = typer.Option(True, "--refs/--no-refs", help="Attach retrieved ADGM references to issues."),
+    jsonl: bool = typer.Option(False, "--jsonl", help="Write report.jsonl (one record per line) instead of report.json, also inside --zip."),
+) -> None:
     folder_path = Path(folder)
     out_dir = Path(out)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    retriever = Retriever(reference_dir="data/reference")
+    retriever = Retriever(reference_dir="data/reference") if refs else None
 
     doc_texts: Dict[str, str] = {}
     doc_types: Dict[str, str] = {}
     for file in folder_path.glob("*.docx"):
-        doc = Document(str(file))
+        doc = load_docx_from_bytes(file.read_bytes())
         text = extract_full_text(doc)
         doc_texts[file.name] = text
         doc_types[file.name] = classify_document_type(text)
@@ -39,33 +46,58 @@ def review(folder: str, out: str = "out") -> None:
     present = set(doc_types.values())
     missing = [r for r in required if r not in present]
 
-    all_issues: List[Dict] = []
+    store = IssueStore()
     for name, text in doc_texts.items():
         dtype = doc_types.get(name, "Unknown")
-        issues = detect_red_flags(dtype, text)
-        for issue in issues:
-            refs = retriever.search(query=issue.get("issue", "") + " ADGM")
-            issue["references"] = refs
-            issue["document"] = dtype
-            issue["file_name"] = name
-        all_issues.extend(issues)
-
-    report = build_report_dict(
+        for issue in detect_red_flags(dtype, text):
+            if retriever is not None:
+                issue["references"] = retriever.search(query=issue.get("issue", "") + " ADGM")
+            store.add_issue(file_name=name, document=dtype, issue=issue)
+
+    report_args = dict(
         process=inferred,
         doc_types=doc_types,
         required_docs=required,
         missing_docs=missing,
-        issues=all_issues,
+        store=store,
     )
-    (out_dir / "report.json").write_text(json.dumps(report, indent=2), encoding="utf-8")
 
-    for file in folder_path.glob("*.docx"):
-        doc = Document(str(file))
-        issues_for_file = [i for i in all_issues if i.get("file_name") == file.name]
-        reviewed = build_reviewed_docx(doc, issues_for_file)
-        reviewed.save(out_dir / f"{file.stem}__reviewed.docx")
+    def reviewed_documents():
+        for file in folder_path.glob("*.docx"):
+            doc = load_docx_from_bytes(file.read_bytes())
+            yield reviewed_docx_name(file.name), build_reviewed_docx(doc, store.for_file(file.name))
+
+    if zip_output:
+        with open(out_dir / "review.zip", "wb") as f:
+            if jsonl:
+                write_review_zip(f, reviewed_documents(), partial(write_report_jsonl, **report_args), report_name="report.jsonl")
+            else:
+                write_review_zip(f, reviewed_documents(), partial(write_report_json, **report_args))
+        print(f"Review archive saved to {(out_dir / 'review.zip').resolve()}")
+        if retriever is not None:
+            _print_cache_info(retriever)
+        return
+
+    if jsonl:
+        with open(out_dir / "report.jsonl", "w", encoding="utf-8") as f:
+            write_report_jsonl(f, **report_args)
+    else:
+        with open(out_dir / "report.json", "w", encoding="utf-8") as f:
+            write_report_json(f, **report_args)
+    for name, reviewed in reviewed_documents():
+        reviewed.save(out_dir / name)
 
     print(f"Report and reviewed docs saved to {out_dir.resolve()}")
+    if retriever is not None:
+        _print_cache_info(retriever)
+
+
+def _print_cache_info(retriever: Retriever) -> None:
+    info = retriever.cache_info()
+    print(
+        f"Retrieval cache: {info['hits']} hits / {info['misses']} misses "
+        f"({info['hit_ratio']:.0%}), {info['entries']} entries, ~{info['approx_bytes'] / 1024:.1f} KiB"
+    )
 
 
 if __name__ == "__main__":